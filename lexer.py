@@ -1,12 +1,285 @@
 import re  # module for regular expressions
 import argparse
+import mmap
+import os
+import stat
+import string
 import sys
+from bisect import bisect_right
+from functools import cache
+from itertools import accumulate, starmap
 from pathlib import Path
 
 
+# Token patterns, in matching priority order
+_PATTERNS = {
+    # Whitespace
+    "NEWLINE": r"\n|\r\n?",
+    "WHITESPACE": r"[ \t]+",
+    # Comments
+    "SINGLE_LINE_COMMENT": r"#[^\n]*",
+    "MULTI_LINE_COMMENT": r"~~[^~]*(?:~[^~]+)*~~",
+    # Numbers
+    "FLOAT": r"-?(?:\d+(?:_\d+)*)?\.\d+(?:_\d+)*",
+    "INTEGER": r"-?\d+(?:_\d+)*",
+    # Type annotations
+    "TYPE_INT": r":int",
+    "TYPE_FLOAT": r":float",
+    "TYPE_STRING": r":str",
+    "TYPE_LIST": r":list",
+    "TYPE_DICT": r":dict",
+    "TYPE_SET": r":set",
+    "TYPE_TUPLE": r":tuple",
+    "TYPE_BOOL": r":bool",
+    # Identifiers
+    "IDENTIFIER": r"\b[a-zA-Z_][a-zA-Z0-9_]*\b",
+    "ARROW": r"->",
+    "LAMBDA_ARROW": r"=>",
+    # Bitwise Operators
+    "BITW_AND": r"&",
+    "BITW_OR": r"\|",
+    "BITW_XOR": r"\^",
+    "BITW_NOT": r"~",
+    "BITW_LEFT_SHIFT": r"<<",
+    "BITW_RIGHT_SHIFT": r">>",
+    # Comparison Operators
+    "EQUALS": r"==",
+    "NOT_EQUALS": r"!=",
+    "LESS_EQUAL": r"<=",
+    "GREATER_EQUAL": r">=",
+    "LESS_THAN": r"<",
+    "GREATER_THAN": r">",
+    # Assignment Operators
+    "ASSIGN": r"=",
+    "PLUS_ASSIGN": r"\+=",
+    "MINUS_ASSIGN": r"-=",
+    "POWER_ASSIGN": r"\*\*=",
+    "FLOOR_DIV_ASSIGN": r"\/\/=",
+    "MULT_ASSIGN": r"\*=",
+    "DIV_ASSIGN": r"\/=",
+    "MOD_ASSIGN": r"%=",
+    # Arithmetic Operators
+    "PLUS": r"\+",
+    "MINUS": r"-",
+    "POWER": r"\*\*",
+    "FLOOR_DIV": r"\/\/",
+    "MULTIPLY": r"\*",
+    "DIVIDE": r"\/",
+    "MODULO": r"%",
+    # Delimiters
+    "LEFT_PAREN": r"\(",
+    "RIGHT_PAREN": r"\)",
+    "LEFT_BRACKET": r"\[",
+    "RIGHT_BRACKET": r"\]",
+    "LEFT_BRACE": r"\{",
+    "RIGHT_BRACE": r"\}",
+    "COMMA": r",",
+    "DOT": r"\.",
+    "COLON": r":",
+    "SEMICOLON": r";",
+    # Strings
+    "MULTI_LINE_STRING": r'"""[^"]*(?:"{1,2}[^"]+)*"""|\'\'\'[^\']*(?:\'{1,2}[^\']+)*\'\'\'',
+    "STRING": r"\"[^\"\\]*(?:\\.[^\"\\]*)*\"|\'[^\'\\]*(?:\\.[^\'\\]*)*\'",
+    # Special tokens
+    "EXCLAIM": r"!",
+    "NULL_COALESCING": r"\?\?",
+    "OPTIONAL_CHAIN": r"\?\.",
+    "QUESTION_MARK": r"\?",
+    # End of file
+    "EOF": r"\Z",
+    # Invalid
+    "INVALID": r".*",
+}
+
+# Reserved words. Keywords are lexed as IDENTIFIER and then looked up here;
+# "not" followed by a single space and "in" becomes one NOTIN token.
+_KEYWORDS = {
+    "if": "IF",
+    "elif": "ELSEIF",
+    "else": "ELSE",
+    "while": "WHILE",
+    "for": "FOR",
+    "def": "DEFINE",
+    "return": "RETURN",
+    "class": "CLASS",
+    "import": "IMPORT",
+    "from": "FROM",
+    "as": "AS",
+    "try": "TRY",
+    "except": "EXCEPT",
+    "finally": "FINALLY",
+    "raise": "RAISE",
+    "with": "WITH",
+    "break": "BREAK",
+    "continue": "CONTINUE",
+    "in": "IN",
+    "is": "IS",
+    # Booleans
+    "True": "TRUE",
+    "False": "FALSE",
+    # Special
+    "None": "NULL",
+    # Logical Operators
+    "not": "NOT",
+    "and": "AND",
+    "or": "OR",
+}
+
+# Combine all patterns into a single regular expression, compiled once at
+# import time. Named groups identify the token type and are joined with '|'.
+_TOKEN_PATTERN = "|".join(
+    f"(?P<{name}>{pattern})" for name, pattern in _PATTERNS.items()
+)
+_TOKEN_REGEX = re.compile(_TOKEN_PATTERN)
+# Source code is almost always pure ASCII, where \w, \b and \d mean the same
+# thing in both modes but ASCII-mode classes are cheaper to test
+_TOKEN_REGEX_ASCII = re.compile(_TOKEN_PATTERN, re.ASCII)
+
+# Characters a token can start with, for patterns that are not a plain literal.
+# Literal patterns (keywords, operators, delimiters) derive theirs from the
+# pattern text; EOF and INVALID are handled separately.
+_START_CHARS = {
+    "NEWLINE": "\n\r",
+    "WHITESPACE": " \t",
+    "FLOAT": "-." + string.digits,
+    "INTEGER": "-" + string.digits,
+    "IDENTIFIER": string.ascii_letters + "_",
+    "MULTI_LINE_STRING": "\"'",
+    "STRING": "\"'",
+    "EOF": "",
+    "INVALID": "",
+}
+
+
+def _start_chars(name, pattern):
+    """Return the characters a token of the given type can start with."""
+    if name in _START_CHARS:
+        return _START_CHARS[name]
+    literal = pattern.removeprefix(r"\b")
+    return literal[1] if literal[0] == "\\" else literal[0]
+
+
+# A pattern without metacharacters, i.e. one that only matches its own text
+_LITERAL_PATTERN = re.compile(r"(?:\\[^\w\s]|[^\\.^$*+?{}\[\]|()])+")
+
+
+def _build_literals():
+    """
+    Build a lookup table for punctuation and operator tokens.
+
+    Only characters whose candidate patterns are all plain literals are
+    included. Each of their literals is listed before any of its prefixes
+    in _PATTERNS, so trying the longest literal first gives the same token
+    as the regex alternation.
+
+    Returns:
+        tuple: (literal text -> (token type, shared literal string), first
+        character -> literal lengths to try, longest first)
+    """
+    literals = {}
+    sizes = {}
+    rejected = set()
+    for name, pattern in _PATTERNS.items():
+        for char in _start_chars(name, pattern):
+            if _LITERAL_PATTERN.fullmatch(pattern):
+                literal = sys.intern(re.sub(r"\\(.)", r"\1", pattern))
+                literals[literal] = (name, literal)
+                sizes.setdefault(char, set()).add(len(literal))
+            else:
+                rejected.add(char)
+    sizes = {
+        char: tuple(sorted(lengths, reverse=True))
+        for char, lengths in sizes.items()
+        if char not in rejected
+    }
+    return literals, sizes
+
+
+_LITERALS, _LITERAL_SIZES = _build_literals()
+
+# Line breaks, counted the same way as the NEWLINE pattern
+_LINE_BREAK = re.compile(r"\r\n?|\n")
+# Characters str.splitlines() also breaks on, but NEWLINE does not
+_OTHER_LINE_BREAKS = re.compile("[\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+
+def _line_starts(text):
+    """Return the offset of the first character of every line."""
+    if _OTHER_LINE_BREAKS.search(text):
+        return [0, *(m.end() for m in _LINE_BREAK.finditer(text))]
+    # Otherwise splitlines() agrees with NEWLINE and is much faster
+    starts = [0, *accumulate(map(len, text.splitlines(True)))]
+    if text and not text.endswith(("\n", "\r")):
+        starts.pop()  # The last line has no break, so no line starts after it
+    return starts
+
+
+# Numbers never start right after a word character (x-1 is x, -, 1); the
+# scanner checks this itself rather than with a lookbehind in each pattern
+_NUMBER_KINDS = ("FLOAT", "INTEGER")
+
+
+@cache
+def _build_after_word(flags=0):
+    """
+    Compile the combined regex without the number patterns, for rescanning
+    a number that turned out to start right after a word character.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{name}>{pattern})"
+            for name, pattern in _PATTERNS.items()
+            if name not in _NUMBER_KINDS
+        ),
+        flags,
+    ).match
+
+
+# Characters tokenize() handles by hand: blanks and line breaks, which it
+# skips without making tokens (mirroring WHITESPACE and NEWLINE), and comment
+# openers, whose extent it finds with str.find (mirroring SINGLE_LINE_COMMENT,
+# MULTI_LINE_COMMENT and BITW_NOT)
+_SCANNED_CHARS = " \t\n\r#~"
+
+# A run of blanks, as matched by the WHITESPACE pattern
+_BLANKS = re.compile(_PATTERNS["WHITESPACE"])
+
+
+@cache
+def _build_dispatch(flags=0):
+    """
+    Build a table mapping each ASCII character to the match function of a
+    smaller regex holding only the alternatives that can start with it.
+
+    Alternatives keep their priority order, and INVALID is always last, so
+    matching at a position gives the same result as the combined regex.
+    Characters covered by the literal table or scanned by hand are left
+    out. Tables are built on first use, so importing the module compiles
+    none of them.
+    """
+    candidates = {}
+    for name, pattern in _PATTERNS.items():
+        for char in _start_chars(name, pattern):
+            candidates.setdefault(char, []).append(name)
+
+    compiled = {}  # Characters with the same alternatives share one regex
+    dispatch = {}
+    for char in map(chr, range(128)):
+        if char in _LITERAL_SIZES or char in _SCANNED_CHARS:
+            continue
+        names = (*candidates.get(char, ()), "INVALID")
+        if names not in compiled:
+            pattern = "|".join(f"(?P<{name}>{_PATTERNS[name]})" for name in names)
+            compiled[names] = re.compile(pattern, flags).match
+        dispatch[char] = compiled[names]
+    return dispatch
+
+
 class Token:
     """A simple class to represent tokens"""
 
+    __slots__ = ("type", "value", "line", "column")
+
     def __init__(self, type, value, line, column):
         self.type = type  # token type (e.g., NUMBER, IDENTIFIER)
         self.value = value  # actual token value
@@ -18,175 +291,305 @@ class Token:
         return f"Type: {self.type:<15} Value: {self.value:<15} Line: {self.line:<4} Col: {self.column}"
 
 
+class TokenStream:
+    """
+    Tokens stored column-wise, one list per Token attribute.
+
+    Token objects are only created when the stream is indexed or iterated,
+    so tokenizing does not allocate an object per token.
+    """
+
+    def __init__(self, types, values, lines, columns):
+        self.types = types  # token types, one per token
+        self.values = values  # token values / lexemes
+        self.lines = lines  # line numbers
+        self.columns = columns  # column numbers
+        self._by_type = None  # token type -> indices, built on first use
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenStream(
+                self.types[index],
+                self.values[index],
+                self.lines[index],
+                self.columns[index],
+            )
+        return Token(
+            self.types[index],
+            self.values[index],
+            self.lines[index],
+            self.columns[index],
+        )
+
+    def __iter__(self):
+        return map(Token, self.types, self.values, self.lines, self.columns)
+
+    def as_columns(self):
+        """
+        Returns the token columns keyed like the results table.
+
+        The lists are shared with the stream, not copied, so a DataFrame can
+        be built from them without visiting each token in Python.
+
+        Returns:
+            dict: Column name (Line, Column, Type, Value) -> list of values
+        """
+        return {
+            "Line": self.lines,
+            "Column": self.columns,
+            "Type": self.types,
+            "Value": self.values,
+        }
+
+    def tokens_of(self, type):
+        """
+        Iterate over the tokens of one type, in source order.
+
+        The stream is bucketed by type in a single pass the first time this
+        is called, so later calls only visit matching tokens.
+
+        Args:
+            type (str): Token type, e.g. IDENTIFIER
+
+        Returns:
+            iterator: Token objects of the given type
+        """
+        if self._by_type is None:
+            by_type = {}
+            for index, kind in enumerate(self.types):
+                by_type.setdefault(kind, []).append(index)
+            self._by_type = by_type
+        return map(self.__getitem__, self._by_type.get(type, ()))
+
+
 class Lexer:
+    patterns = _PATTERNS
+    keywords = _KEYWORDS
+    token_regex = _TOKEN_REGEX
+
     def __init__(self, input_text, include_comments=False):
+        if not isinstance(input_text, str):
+            # Bytes-like input (bytes, bytearray, memoryview, mmap) is UTF-8
+            # source; decode it once up front
+            input_text = str(input_text, "utf-8")
         self.input_text = input_text
-        self.current_line = 1
-        self.pos = 0
         self.tokens = []
-        self.current_char = self.input_text[self.pos]
         self.include_comments = include_comments
-        self.patterns = {
-            # Whitespace
-            "NEWLINE": r"\n|\r\n?",
-            "WHITESPACE": r"[ \t]+",
-            # Comments
-            "SINGLE_LINE_COMMENT": r"#[^\n]*",
-            "MULTI_LINE_COMMENT": r"~~[\s\S]*?~~",
-            # Numbers
-            "FLOAT": r"(?<!\w)-?(\d+(_?\d+)*)?\.\d+(_?\d+)*",
-            "INTEGER": r"(?<!\w)-?\d+(_?\d+)*",
-            # Keywords
-            "TYPE_INT": r":int",
-            "TYPE_FLOAT": r":float",
-            "TYPE_STRING": r":str",
-            "TYPE_LIST": r":list",
-            "TYPE_DICT": r":dict",
-            "TYPE_SET": r":set",
-            "TYPE_TUPLE": r":tuple",
-            "TYPE_BOOL": r":bool",
-            "IF": r"\bif\b",
-            "ELSEIF": r"\belif\b",
-            "ELSE": r"\belse\b",
-            "WHILE": r"\bwhile\b",
-            "FOR": r"\bfor\b",
-            "DEFINE": r"\bdef\b",
-            "RETURN": r"\breturn\b",
-            "CLASS": r"\bclass\b",
-            "IMPORT": r"\bimport\b",
-            "FROM": r"\bfrom\b",
-            "AS": r"\bas\b",
-            "TRY": r"\btry\b",
-            "EXCEPT": r"\bexcept\b",
-            "FINALLY": r"\bfinally\b",
-            "RAISE": r"\braise\b",
-            "WITH": r"\bwith\b",
-            "BREAK": r"\bbreak\b",
-            "CONTINUE": r"\bcontinue\b",
-            "NOTIN": r"\bnot in\b",
-            "IN": r"\bin\b",
-            "IS": r"\bis\b",
-            # Booleans
-            "TRUE": r"\bTrue\b",
-            "FALSE": r"\bFalse\b",
-            # Special
-            "NULL": r"\bNone\b",
-            # Logical Operators
-            "NOT": r"\bnot\b",
-            "AND": r"\band\b",
-            "OR": r"\bor\b",
-            # Identifiers
-            "IDENTIFIER": r"\b[a-zA-Z_][a-zA-Z0-9_]*\b",
-            "ARROW": r"->",
-            "LAMBDA_ARROW": r"=>",
-            # Bitwise Operators
-            "BITW_AND": r"&",
-            "BITW_OR": r"\|",
-            "BITW_XOR": r"\^",
-            "BITW_NOT": r"~",
-            "BITW_LEFT_SHIFT": r"<<",
-            "BITW_RIGHT_SHIFT": r">>",
-            # Comparison Operators
-            "EQUALS": r"==",
-            "NOT_EQUALS": r"!=",
-            "LESS_EQUAL": r"<=",
-            "GREATER_EQUAL": r">=",
-            "LESS_THAN": r"<",
-            "GREATER_THAN": r">",
-            # Assignment Operators
-            "ASSIGN": r"=",
-            "PLUS_ASSIGN": r"\+=",
-            "MINUS_ASSIGN": r"-=",
-            "POWER_ASSIGN": r"\*\*=",
-            "FLOOR_DIV_ASSIGN": r"\/\/=",
-            "MULT_ASSIGN": r"\*=",
-            "DIV_ASSIGN": r"\/=",
-            "MOD_ASSIGN": r"%=",
-            # Arithmetic Operators
-            "PLUS": r"\+",
-            "MINUS": r"-",
-            "POWER": r"\*\*",
-            "FLOOR_DIV": r"\/\/",
-            "MULTIPLY": r"\*",
-            "DIVIDE": r"\/",
-            "MODULO": r"%",
-            # Delimiters
-            "LEFT_PAREN": r"\(",
-            "RIGHT_PAREN": r"\)",
-            "LEFT_BRACKET": r"\[",
-            "RIGHT_BRACKET": r"\]",
-            "LEFT_BRACE": r"\{",
-            "RIGHT_BRACE": r"\}",
-            "COMMA": r",",
-            "DOT": r"\.",
-            "COLON": r":",
-            "SEMICOLON": r";",
-            # Strings
-            "MULTI_LINE_STRING": r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'',
-            "STRING": r"\"(?:\\.|[^\"\\])*\"|\'(?:\\.|[^\'\\])*\'",
-            # Special tokens
-            "EXCLAIM": r"!",
-            "NULL_COALESCING": r"\?\?",
-            "OPTIONAL_CHAIN": r"\?\.",
-            "QUESTION_MARK": r"\?",
-            # End of file
-            "EOF": r"\Z",
-            # Invalid
-            "INVALID": r".*",
-        }
+        # Offset of the first character of every line
+        self._line_starts = _line_starts(input_text)
+        if input_text.isascii():
+            self.token_regex = _TOKEN_REGEX_ASCII
+            flags = re.ASCII
+        else:
+            flags = 0
+        self._dispatch = _build_dispatch(flags)
+        self._after_word = _build_after_word(flags)
+
+    @classmethod
+    def from_file(cls, path, include_comments=False):
+        """
+        Create a lexer for a source file.
+
+        Regular files are memory-mapped and decoded straight from the
+        mapping, so their contents are not first copied into an intermediate
+        bytes object. Pipes and other streams are read normally.
 
-        # Combine all patterns into a single regular expression
-        # Use named groups to identify the token type
-        pattern_strings = [
-            f"(?P<{name}>{pattern})" for name, pattern in self.patterns.items()
-        ]
-        # Join all patterns with the OR operator '|'
-        self.token_regex = re.compile("|".join(pattern_strings))
+        Args:
+            path (str | Path): Path to a UTF-8 encoded source file
+            include_comments (bool): Whether to emit comment tokens
+
+        Returns:
+            Lexer: Lexer over the file's contents
+        """
+        with open(path, "rb") as file:
+            info = os.fstat(file.fileno())
+            if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+                # Empty files cannot be mapped, and pipes report a size of 0
+                return cls(file.read(), include_comments)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return cls(buffer, include_comments)
 
     def __str__(self):
         """String representation of the Lexer"""
         status = f"Number of Tokens: {len(self.tokens)}\n"
         return status
 
-    def tokenize(self) -> list:
+    def tokenize(self) -> TokenStream:
+        """
+        Tokenize the input text into a stream of tokens.
+
+        Returns:
+            TokenStream: Tokens in source order, iterable as Token objects
         """
-        Tokenize the input text into a list of tokens.
+        types = []
+        values = []
+        lines = []
+        columns = []
+        append_type = types.append
+        append_value = values.append
+        append_line = lines.append
+        append_column = columns.append
+        for kind, value, line, column in self._tokenize_iter():
+            append_type(kind)
+            append_value(value)
+            append_line(line)
+            append_column(column)
+
+        self.tokens = TokenStream(types, values, lines, columns)
+        return self.tokens
+
+    def tokens_as_columns(self):
+        """
+        Returns the tokens as columns keyed like the results table,
+        tokenizing the input first if that has not been done yet.
 
         Returns:
-            list: List of Token objects
+            dict: Column name (Line, Column, Type, Value) -> list of values
+        """
+        if not self.tokens:
+            self.tokenize()
+        return self.tokens.as_columns()
+
+    def iter_tokens(self):
+        """
+        Iterate over the tokens as they are scanned, without storing them.
+
+        Returns:
+            Iterator[Token]: Tokens in source order, ending with EOF
+        """
+        return starmap(Token, self._tokenize_iter())
+
+    def _tokenize_iter(self):
+        """
+        Scan the input text, yielding tokens as they are found.
+
+        Yields:
+            tuple: (type, value, line, column) for each token, ending with EOF
         """
-        tokens = []
         line_num = 1
         line_start = 0  # Track the start position of current line
 
-        for token_match in self.token_regex.finditer(self.input_text):
-            kind = token_match.lastgroup  # The last matched group name (token type)
-            value = token_match.group()  # Actual token value / lexeme
-            start_pos = token_match.start()
-            column = start_pos - line_start + 1  # Calculate column number
-
-            # Skip whitespace
-            if kind == "WHITESPACE":
+        # Bind hot attributes to locals once instead of per match
+        include_comments = self.include_comments
+        text = self.input_text
+        length = len(text)
+        dispatch = self._dispatch
+        fallback = self.token_regex.match
+        after_word = self._after_word
+        skip_blanks = _BLANKS.match
+        literals = _LITERALS
+        literal_sizes = _LITERAL_SIZES
+        keywords = self.keywords
+        intern = sys.intern
+        # Line start offsets, with a sentinel past the end of the text
+        line_starts = [*self._line_starts, length + 1]
+        next_line_start = line_starts[1]  # Tokens before this are on line_num
+
+        pos = 0
+        while pos < length:
+            char = text[pos]
+            if char == " " or char == "\t":
+                # Blanks separate tokens without being tokens; most gaps are
+                # a single space, which needs no match object
+                pos += 1
+                if pos < length and text[pos] in " \t":
+                    pos = skip_blanks(text, pos).end()
                 continue
-
-            if kind == "NEWLINE":
+            if char == "\n" or char == "\r":
+                # The line break runs up to the start of the next line
                 line_num += 1
-                line_start = start_pos + len(value)
+                line_start = pos = next_line_start
+                next_line_start = line_starts[line_num]
                 continue
 
-            if not self.include_comments and kind in ["SINGLE_LINE_COMMENT", "MULTI_LINE_COMMENT"]:
-                continue
-            
-            if kind in ["MULTI_LINE_COMMENT", "STRING"]:
-                lines_in_token = value.count("\n")
-                tokens.append(Token(kind, value, line_num, column))
-                line_num += lines_in_token
-                if lines_in_token > 0:
-                    line_start = start_pos + value.rfind("\n") + 1
+            start_pos = pos
+            matcher = dispatch.get(char)
+            if matcher is not None:
+                token_match = matcher(text, pos)
+                kind = token_match.lastgroup  # The last matched group name (token type)
+                value = token_match.group(0)  # Actual token value / lexeme
+                pos = token_match.end()
+
+                if kind == "IDENTIFIER":
+                    # Names repeat throughout a file; share one string each
+                    value = intern(value)
+                    kind = keywords.get(value, kind)
+                    if kind == "NOT" and text.startswith(" in", pos):
+                        after = pos + 3
+                        if after == length or not (
+                            text[after].isalnum() or text[after] == "_"
+                        ):
+                            kind = "NOTIN"
+                            value = "not in"
+                            pos = after
+                elif (kind == "INTEGER" or kind == "FLOAT") and start_pos:
+                    before = text[start_pos - 1]
+                    if before.isalnum() or before == "_":
+                        # Not a number after all; take the next alternative
+                        token_match = after_word(text, start_pos)
+                        kind = token_match.lastgroup
+                        value = token_match.group(0)
+                        pos = token_match.end()
+            elif char in literal_sizes:
+                # Punctuation and operators resolve through a table lookup,
+                # trying the longest literal first
+                for size in literal_sizes[char]:
+                    literal = literals.get(text[pos : pos + size])
+                    if literal is not None:
+                        break
+                kind, value = literal  # Every token shares the table's string
+                pos += len(value)
+            elif char == "#":
+                # A comment runs to the end of the line
+                pos = text.find("\n", pos)
+                if pos < 0:
+                    pos = length
+                kind = "SINGLE_LINE_COMMENT"
+                value = text[start_pos:pos]
+            elif char == "~":
+                # A multi-line comment runs to the first closing ~~; without
+                # one, the ~ is a bitwise not
+                end = text.find("~~", pos + 2) if text.startswith("~~", pos) else -1
+                if end < 0:
+                    kind = "BITW_NOT"
+                    value = "~"
+                    pos += 1
+                else:
+                    kind = "MULTI_LINE_COMMENT"
+                    pos = end + 2
+                    value = text[start_pos:pos]
             else:
-                tokens.append(Token(kind, value, line_num, column))
-        self.tokens = tokens
-        return tokens
+                # Only non-ASCII characters miss every table. Some of them are
+                # digits, which cannot start a number right after a word
+                before = text[pos - 1] if pos else ""
+                if before.isalnum() or before == "_":
+                    token_match = after_word(text, pos)
+                else:
+                    token_match = fallback(text, pos)
+                kind = token_match.lastgroup
+                value = token_match.group(0)
+                pos = token_match.end()
+
+            line = line_num
+            column = start_pos - line_start + 1  # Calculate column number
+            if pos >= next_line_start:
+                # Strings and comments can span lines; look up the line the
+                # token ends on instead of counting newlines inside it
+                line_num = bisect_right(line_starts, pos)
+                line_start = line_starts[line_num - 1]
+                next_line_start = line_starts[line_num]
+
+            if not include_comments and (
+                kind == "SINGLE_LINE_COMMENT" or kind == "MULTI_LINE_COMMENT"
+            ):
+                continue
+
+            yield kind, value, line, column
+
+        yield "EOF", "", line_num, length - line_start + 1
 
     def get_patterns(self):
         """
@@ -197,8 +600,23 @@ class Lexer:
         """
         return self.patterns
 
+    def get_keywords(self):
+        """
+        Returns a dictionary of reserved words and their token types.
+
+        Returns:
+            dict: Dictionary mapping keywords to their token types
+        """
+        return self.keywords
+
     def get_complete_pattern(self, console_readable=False) -> str:
-        """Returns the complete regex pattern used for tokenization."""
+        """
+        Returns the combined regex pattern of all token types.
+
+        The pattern alone is not the full rule set: the scanner also looks up
+        keywords among identifiers, joins "not in", and keeps numbers from
+        starting right after a word character (x-1 is x, MINUS, 1).
+        """
         # Get the scanner's pattern directly
         pattern = self.token_regex.pattern
 
@@ -212,34 +630,32 @@ class Lexer:
         Print the input code with proper formatting and line numbers.
         """
         lines = self.input_text.split("\n")
-        print("-" * 40)
-        for i, line in enumerate(lines, 1):
-            print(f"{i:2d} | {line}")
-        print("-" * 40)
+        numbered = "".join(f"{i:2d} | {line}\n" for i, line in enumerate(lines, 1))
+        sys.stdout.write(f"{'-' * 40}\n{numbered}{'-' * 40}\n")
 
     def print_tokens(self):
         """
         Print all tokens in a readable format.
+
+        Tokens are formatted and written as they are scanned, without
+        storing them; stdout's buffer batches the writes.
         """
-        tokens = self.tokens
-        for token in tokens:
-            print(token)  # Uses Token.__str__ method
+        sys.stdout.writelines(f"{token}\n" for token in self.iter_tokens())
 
 
 def print_tokens_table(tokens):
     """Print tokens in a formatted table"""
-    # Print table header
-    print("\nTokenization Results:")
-    print("-" * 80)
-    print(f"{'Line':<6} {'Column':<8} {'Token Type':<20} {'Value':<30}")
-    print("-" * 80)
-
-    # Print each token
-    for token in tokens:
-        print(
-            f"{token.line:<6} {token.column:<8} {token.type:<20} {repr(token.value):<30}"
-        )
-    print("-" * 80)
+    rule = "-" * 80
+    header = f"{'Line':<6} {'Column':<8} {'Token Type':<20} {'Value':<30}"
+    sys.stdout.write(f"\nTokenization Results:\n{rule}\n{header}\n{rule}\n")
+
+    # Stream the rows through stdout's buffer instead of one print() per
+    # token, so tokens are never all held at once
+    sys.stdout.writelines(
+        f"{token.line:<6} {token.column:<8} {token.type:<20} {repr(token.value):<30}\n"
+        for token in tokens
+    )
+    sys.stdout.write(f"{rule}\n")
 
 
 def main():
@@ -251,6 +667,9 @@ def main():
     parser.add_argument(
         "-c", "--comments", action="store_true", help="Include comments in tokenization"
     )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Show the input code"
+    )
     args = parser.parse_args()
 
     try:
@@ -260,19 +679,18 @@ def main():
             print(f"Error: File '{args.file}' not found")
             sys.exit(1)
 
+        # Text mode turns CRLF and lone CR line endings into LF, so comments
+        # and invalid tokens do not pick up a trailing \r
         code = file_path.read_text(encoding="utf-8")
+        lexer = Lexer(code, include_comments=args.comments)
 
-        # Print input code
-        print("\nInput Code:")
-        print("-" * 40)
-        for i, line in enumerate(code.split("\n"), 1):
-            print(f"{i:2d} | {line}")
-        print("-" * 40)
+        # Print input code if requested
+        if args.verbose:
+            print("\nInput Code:")
+            lexer.print_input_code()
 
-        # Tokenize and print results
-        lexer = Lexer(code, include_comments=args.comments)
-        tokens = lexer.tokenize()
-        print_tokens_table(tokens)
+        # Tokenize and print results, streaming tokens as they are scanned
+        print_tokens_table(lexer.iter_tokens())
 
         # Show patterns if requested
         if args.patterns:
@@ -281,6 +699,11 @@ def main():
             for name, pattern in lexer.get_patterns().items():
                 print(f"{name:<20} {pattern}")
             print("-" * 80)
+            print("\nKeywords:")
+            print("-" * 80)
+            for word, kind in lexer.get_keywords().items():
+                print(f"{kind:<20} {word}")
+            print("-" * 80)
 
     except Exception as e:
         print(f"Error: {str(e)}")
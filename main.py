@@ -1,17 +1,31 @@
 import streamlit as st
 from streamlit_ace import st_ace
-import pandas as pd
 from pathlib import Path
 from lexer import Lexer
 
 
+@st.cache_resource
 def load_samples():
+    # Read once per server process; returns (name, code) pairs sorted by name
     samples = {}
     samples_dir = Path(__file__).parent / "samples"
     if samples_dir.exists():
         for file in samples_dir.glob("*.worm"):
             samples[file.stem] = file.read_text(encoding="utf-8")
-    return samples
+    return tuple(sorted(samples.items()))
+
+
+@st.cache_data(show_spinner=False)
+def _lex(code, include_comments):
+    # Reruns that leave the code untouched reuse the cached columns
+    return Lexer(code, include_comments=include_comments).tokens_as_columns()
+
+
+@st.cache_resource
+def _pattern_info():
+    # Patterns and keywords do not depend on the input, so build them once
+    lexer = Lexer("")
+    return lexer.get_patterns(), lexer.get_keywords(), lexer.get_complete_pattern()
 
 
 # Page config
@@ -45,8 +59,8 @@ with left_col:
         samples = load_samples()
         if samples:
             preset_buttons_columns = st.columns(len(samples))
-            for i, (name, code) in enumerate(sorted(samples.items())):
-                with preset_buttons_columns[i]:
+            for column, (name, code) in zip(preset_buttons_columns, samples):
+                with column:
                     if st.button(name, use_container_width=True):
                         st.session_state.code_content = code
         else:
@@ -66,22 +80,20 @@ with left_col:
 
     # Tokenize handler
     if code_input:
-        # Create lexer instance and tokenize
-        lexer = Lexer(code_input, include_comments=True)
-        tokens = lexer.tokenize()
-
-        # Convert tokens to DataFrame
-        df = pd.DataFrame(
-            [
-                {
-                    "Line": token.line,
-                    "Column": token.column,
-                    "Type": token.type,
-                    "Value": token.value,
-                }
-                for token in tokens
-            ]
-        )
+        # Reruns from other widgets reuse this session's last table as long
+        # as the code is unchanged
+        if st.session_state.get("lex_code") != code_input:
+            # Tokenize (cached per code and comment setting)
+            columns = _lex(code_input, True)
+
+            # Build the DataFrame straight from the token columns. pandas is
+            # slow to import, so it is only loaded once there is code to show
+            import pandas as pd
+
+            columns["Type"] = pd.Categorical(columns["Type"])
+            st.session_state.lex_df = pd.DataFrame(columns, copy=False)
+            st.session_state.lex_code = code_input
+        df = st.session_state.lex_df
 
         # Display results in right column
         with right_col:
@@ -107,7 +119,14 @@ with left_col:
             st.error("Please enter some code or upload a file first.")
 
 st.divider()
+patterns, keywords, complete_pattern = _pattern_info()
 with st.expander("Individual patterns", icon="🔍"):
-    st.write(lexer.get_patterns())
+    st.write(patterns)
+with st.expander("Keywords", icon="🔑"):
+    st.write(keywords)
 with st.expander("Complete pattern", icon="🌎"):
-    st.write(repr(lexer.get_complete_pattern()))
+    st.caption(
+        "Keywords, `not in` and numbers right after a word character "
+        "(`x-1` is `x`, `-`, `1`) are resolved by the scanner, not by this pattern."
+    )
+    st.write(repr(complete_pattern))
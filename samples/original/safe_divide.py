@@ -1,5 +1,22 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
 def safe_divide(x: float, y: float) -> float | None:
     try:
         return x / y
     except ZeroDivisionError:
-        return None
\ No newline at end of file
+        return None
+
+
+def safe_divide_vec(x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+    # Divides whole arrays at once; a zero divisor gives NaN instead of None.
+    # numpy is only needed here, so the scalar version works without it
+    import numpy as np
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(y != 0, x / y, np.nan)